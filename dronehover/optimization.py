@@ -1,10 +1,50 @@
 import warnings
 import numpy as np
 from numpy.linalg import inv, norm
-from scipy.optimize import minimize
 
 G = 9.81    # gravitational acceleration
 
+def _load_minimize():
+    """Import scipy.optimize.minimize on first use.
+
+    SciPy is only needed by the solvers, so body construction and the
+    effectiveness matrix analysis do not pay for its import time.
+    """
+    from scipy.optimize import minimize
+    return minimize
+
+def gravity_body(attitudes):
+    """Rotate the gravity vector into the body-fixed frame (NED, z-y-x Euler angles).
+
+    Args:
+        attitudes (array): Attitudes [roll, pitch] or [roll, pitch, yaw] in radians, shape (2,), (3,) or (N, 2), (N, 3).
+                           Yaw does not change the gravity vector and is ignored.
+
+    Returns:
+        array: Gravity vector in the body-fixed frame, shape (3,) or (N, 3).
+    """
+    attitudes = np.asarray(attitudes, dtype=float)
+    roll = attitudes[..., 0]
+    pitch = attitudes[..., 1]
+    return G * np.stack((-np.sin(pitch),
+                         np.sin(roll)*np.cos(pitch),
+                         np.cos(roll)*np.cos(pitch)), axis=-1)
+
+def attitude_grid(num_roll=72, num_pitch=37):
+    """Grid of [roll, pitch] attitudes covering every direction of the gravity vector in the body frame.
+
+    Args:
+        num_roll (int): Number of roll angles in [-pi, pi).
+        num_pitch (int): Number of pitch angles in [-pi/2, pi/2].
+
+    Returns:
+        array: Attitudes [roll, pitch] in radians, shape (num_roll*num_pitch, 2).
+    """
+    roll = np.linspace(-np.pi, np.pi, num_roll, endpoint=False)
+    pitch = np.linspace(-np.pi/2, np.pi/2, num_pitch)
+    roll, pitch = np.meshgrid(roll, pitch, indexing="ij")
+    return np.column_stack((roll.ravel(), pitch.ravel()))
+
 class Hover:
     def __init__(self, drone):
         """Optimal hover optimizer which computes the hovering capabilities of a drone.
@@ -107,6 +147,7 @@ class Hover:
             bnds.append((self.w_hat_bounds[0]**2, self.w_hat_bounds[1]**2)) 
         opt = {'maxiter':1000, 'ftol':tol}
         
+        minimize = _load_minimize()
         with warnings.catch_warnings():
             warnings.filterwarnings("ignore", message="Values in x were outside bounds")
             static_hover = minimize(objective_function, eta0, constraints=cons, bounds=bnds, method='SLSQP', options=opt)
@@ -178,6 +219,7 @@ class Hover:
             bnds.append((self.w_hat_bounds[0]**2, self.w_hat_bounds[1]**2)) 
         opt = {'maxiter':1000, 'ftol':5e-3}
         
+        minimize = _load_minimize()
         with warnings.catch_warnings():
             warnings.filterwarnings("ignore", message="Values in x were outside bounds")
             spinning_hover = minimize(objective_function, eta0, constraints=cons, bounds=bnds, method='SLSQP', options=opt)
@@ -228,6 +270,117 @@ class Hover:
                 print(f"Force-torque cross product norm: {norm(np.cross(f,self.tau)):.5f}")
             
             
+    def trim(self, attitude, verbose=False, tol=1e-5):
+        """Compute the most efficient hover inputs at a commanded attitude.
+           Gravity is rotated into the body frame and the inputs must cancel it with zero torque,
+           giving a linear equality, box bounded QP in eta.
+
+        Args:
+            attitude (array): Attitude [roll, pitch] or [roll, pitch, yaw] in radians.
+            verbose (bool): Print the trim results.
+            tol (float): Tolerance on the equality constraints and solver.
+
+        Returns:
+            tuple: (feasible, eta, input_cost). eta and input_cost are None if the attitude cannot be trimmed.
+        """
+        feasible, eta, cost = self.trim_map(attitude, tol)
+        if feasible[0]:
+            eta = eta[0]
+            cost = cost[0]
+        else:
+            eta = None
+            cost = None
+
+        if verbose:
+            if feasible[0]:
+                print("----------Trim Achieved----------")
+                print(f'Optimum input = {self.w_to_u(np.sqrt(eta))}')
+                print(f'Resultant specific force: {norm(self.Bf @ eta):.2f}')
+                print(f'Resultant specific torque: {norm(self.Bm @ eta):.2f}')
+                print(f"Input cost: {cost:.5f}")
+            else:
+                print("Drone cannot hover at this attitude")
+
+        return bool(feasible[0]), eta, cost
+
+
+    def trim_map(self, attitudes, tol=1e-5):
+        """Compute the most efficient hover inputs for many attitudes at once (see trim).
+           The minimum norm solution from the factorization of [Bf; Bm] is computed for all
+           attitudes together, and only attitudes where it violates the input bounds are passed to SLSQP.
+
+        Args:
+            attitudes (array): Attitudes [roll, pitch] or [roll, pitch, yaw] in radians, shape (N, 2) or (N, 3).
+                               A single attitude is treated as N = 1.
+            tol (float): Tolerance on the equality constraints and solver.
+
+        Returns:
+            tuple: (feasible, eta, input_cost) with shapes (N,), (N, num_props), (N,).
+                   eta and input_cost are nan for attitudes that cannot be trimmed.
+        """
+        attitudes = np.atleast_2d(np.asarray(attitudes, dtype=float))
+        if attitudes.ndim != 2 or attitudes.shape[1] not in (2, 3):
+            raise ValueError(f"Attitudes must have shape (N, 2) or (N, 3), got {attitudes.shape}")
+
+        b = np.hstack((-gravity_body(attitudes), np.zeros((len(attitudes), 3))))
+        U, S, V = self._trim_factors()
+        lb = self.w_hat_bounds[0]**2
+        ub = self.w_hat_bounds[1]**2
+
+        # Attitudes where b is outside the range of [Bf; Bm] cannot be trimmed for any input
+        c = b @ U
+        consistent = norm(b - c @ U.T, axis=1) <= tol * G
+
+        # Minimum norm solution, optimal whenever it lies within the input bounds
+        eta = (c / S) @ V.T
+        feasible = consistent & np.all((eta >= lb - tol) & (eta <= ub + tol), axis=1)
+
+        # With full column rank the solution is unique, otherwise search the null space with the bounds active
+        if len(S) < self.num_props:
+            for i in np.flatnonzero(consistent & ~feasible):
+                eta[i], feasible[i] = self._trim_solve(b[i], np.clip(eta[i], lb, ub), tol)
+
+        eta = np.clip(eta, lb, ub)
+        eta[~feasible] = np.nan
+        return feasible, eta, np.sum(eta**2, axis=1)
+
+
+    def _trim_factors(self):
+        """Factorization of the trim constraints [Bf; Bm] eta = [-g; 0], computed on first use
+           and reused for every attitude.
+        """
+        if not hasattr(self, "_trim_U"):
+            U, S, Vt = np.linalg.svd(np.vstack((self.Bf, self.Bm)), full_matrices=False)
+            rank = np.sum(S > S[0] * max(6, self.num_props) * np.finfo(float).eps)
+            self._trim_U = U[:, :rank]
+            self._trim_S = S[:rank]
+            self._trim_V = Vt[:rank, :].T
+        return self._trim_U, self._trim_S, self._trim_V
+
+
+    def _trim_solve(self, b, eta0, tol):
+        """Solve the trim QP with the input bounds active using SLSQP.
+        """
+        # Independent equality constraints from the factorization of [Bf; Bm]
+        U, S, V = self._trim_factors()
+        C = S[:,np.newaxis] * V.T
+        d = U.T @ b
+
+        cons = [{"type":"eq", "fun":lambda eta: C @ eta - d, "jac":lambda eta: C}]
+        bnds = [(self.w_hat_bounds[0]**2, self.w_hat_bounds[1]**2)] * self.num_props
+        opt = {'maxiter':1000, 'ftol':tol**2}
+
+        minimize = _load_minimize()
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore", message="Values in x were outside bounds")
+            trim = minimize(lambda eta: eta.T @ eta, eta0, jac=lambda eta: 2*eta, constraints=cons,
+                            bounds=bnds, method='SLSQP', options=opt)
+
+        A = np.vstack((self.Bf, self.Bm))
+        success = trim.success and norm(A @ trim.x - b) <= tol * G
+        return trim.x, success
+
+            
     def drone_checker(self):
         """Check that drone propeller dictionary has the required format.
 
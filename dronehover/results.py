@@ -0,0 +1,296 @@
+import os
+import uuid
+import numpy as np
+
+# Hover status codes, None is stored for drones where compute_hover was not called
+STATUS_CODES = {None: -1, "N": 0, "ST": 1, "SP": 2}
+
+# Per-drone scalar columns (dtype, width)
+SCALARS = {"status": (np.int8, 1),
+           "alpha": (np.float64, 1),
+           "input_cost": (np.float64, 1),
+           "rank_f": (np.int8, 1),
+           "rank_m": (np.int8, 1),
+           "eig_f": (np.float64, 3),
+           "eig_m": (np.float64, 3),
+           "num_props": (np.int16, 1),
+           "design_id": (np.int64, 1),
+           "offset": (np.int64, 1)}    # Written last, marks a row as complete
+
+# Per-propeller columns, stored flat and indexed by "offset" and "num_props"
+VECTORS = ("eta", "u", "w_hat")
+
+def _column_file(shard_dir, name):
+    return os.path.join(shard_dir, f"{name}.bin")
+
+def _column_dtype(name):
+    return SCALARS[name][0] if name in SCALARS else np.float64
+
+def _column_width(name):
+    return SCALARS[name][1] if name in SCALARS else 1
+
+def _column_length(shard_dir, name):
+    file = _column_file(shard_dir, name)
+    if not os.path.exists(file):
+        return 0
+    return os.path.getsize(file) // (np.dtype(_column_dtype(name)).itemsize * _column_width(name))
+
+def _column_size(name, length):
+    """Size in bytes of a column with length rows.
+    """
+    return length * np.dtype(_column_dtype(name)).itemsize * _column_width(name)
+
+def _complete_rows(shard_dir):
+    """Number of complete rows in a shard and the number of per-propeller values they use.
+       A row is complete when every scalar column holds it and its per-propeller values
+       fit inside every per-propeller column.
+    """
+    num_rows = min(_column_length(shard_dir, name) for name in SCALARS)
+    if num_rows == 0:
+        return 0, 0
+    num_values = min(_column_length(shard_dir, name) for name in VECTORS)
+
+    offset = _open_column(shard_dir, "offset", num_rows)
+    num_props = _open_column(shard_dir, "num_props", num_rows)
+    if offset[-1] + num_props[-1] > num_values:
+        # Row ends are nondecreasing, keep the rows that end inside the per-propeller columns
+        ends = offset.astype(np.int64) + num_props
+        num_rows = int(np.searchsorted(ends, num_values, side="right"))
+    if num_rows == 0:
+        return 0, 0
+    return num_rows, int(offset[num_rows-1]) + int(num_props[num_rows-1])
+
+def _open_column(shard_dir, name, length):
+    """Memory map the first length rows of a column file (read only).
+    """
+    shape = (length,) if _column_width(name) == 1 else (length, _column_width(name))
+    if length == 0:
+        return np.empty(shape, dtype=_column_dtype(name))
+    return np.memmap(_column_file(shard_dir, name), dtype=_column_dtype(name), mode="r", shape=shape)
+
+
+# Shards opened by writers in this process
+_open_shards = set()
+
+
+class ResultsWriter:
+    def __init__(self, path, shard=None, buffer_size=4096):
+        """Appends hover results to a results store on disk.
+
+        Each writer owns a shard (subdirectory of path) so that several worker processes can
+        append to the same store without locking. Only one writer can have a shard open at a time.
+        Rows are buffered in memory and appended to the column files on flush. Buffered rows are
+        lost unless flush() or close() is called (or the writer is used as a context manager),
+        which includes writers opened in a process pool initializer.
+
+        Args:
+            path (str): Directory of the results store.
+            shard (str): Name of the shard to append to. Defaults to a new shard named after the
+                         process id and a random suffix.
+            buffer_size (int): Number of rows buffered before they are flushed to disk.
+
+        Raises:
+            ValueError: Shard is already open by another writer in this process.
+        """
+        if shard is None:
+            shard = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self.shard_dir = os.path.abspath(os.path.join(path, str(shard)))
+        if self.shard_dir in _open_shards:
+            raise ValueError(f"Shard \"{shard}\" is already open by another writer")
+        os.makedirs(self.shard_dir, exist_ok=True)
+        _open_shards.add(self.shard_dir)
+        self.buffer_size = buffer_size
+
+        self.num_rows, self.num_values = self._repair()
+        self._clear_buffer()
+
+    def _repair(self):
+        """Truncate columns left partially written by an interrupted flush to the complete rows.
+        """
+        num_rows, num_values = _complete_rows(self.shard_dir)
+
+        for name in list(SCALARS) + list(VECTORS):
+            file = _column_file(self.shard_dir, name)
+            size = _column_size(name, num_rows if name in SCALARS else num_values)
+            if os.path.exists(file) and os.path.getsize(file) != size:
+                with open(file, "r+b") as f:
+                    f.truncate(size)
+
+        return num_rows, num_values
+
+    def _clear_buffer(self):
+        self._scalars = {name: [] for name in SCALARS}
+        self._vectors = {name: [] for name in VECTORS}
+        self._buffered = 0
+
+    def append(self, sim, design_id=-1):
+        """Add the results of a Hover object after compute_hover has been called.
+
+        Args:
+            sim (class): Hover object.
+            design_id (int): Identifier of the design, used to map rows back to the sweep inputs.
+        """
+        status = getattr(sim, "hover_status", None)
+        eta = np.asarray(getattr(sim, "eta", np.full(sim.num_props, np.nan)), dtype=np.float64)
+
+        if status in ("ST", "SP"):
+            w_hat = sim.w_hat
+            u = sim.u
+        else:
+            w_hat = np.sqrt(eta)
+            u = sim.w_to_u(w_hat)
+
+        alpha = getattr(sim, "alpha", None)
+        input_cost = getattr(sim, "input_cost", None)
+
+        row = {"status": STATUS_CODES[status],
+               "alpha": np.nan if alpha is None else alpha,
+               "input_cost": np.nan if input_cost is None else input_cost,
+               "rank_f": sim.rank_f,
+               "rank_m": sim.rank_m,
+               "eig_f": np.real(sim.eig_f),
+               "eig_m": np.real(sim.eig_m),
+               "num_props": sim.num_props,
+               "design_id": design_id,
+               "offset": self.num_values}
+        for name in SCALARS:
+            self._scalars[name].append(row[name])
+
+        self._vectors["eta"].append(eta)
+        self._vectors["u"].append(np.asarray(u, dtype=np.float64))
+        self._vectors["w_hat"].append(np.asarray(w_hat, dtype=np.float64))
+
+        self.num_rows += 1
+        self.num_values += sim.num_props
+        self._buffered += 1
+        if self._buffered >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        """Append buffered rows to the column files.
+        """
+        if self._buffered == 0:
+            return
+
+        # Per-propeller columns first and "offset" last, so an interrupted flush can be detected
+        for name in VECTORS:
+            with open(_column_file(self.shard_dir, name), "ab") as f:
+                np.concatenate(self._vectors[name]).astype(np.float64).tofile(f)
+
+        for name in SCALARS:
+            with open(_column_file(self.shard_dir, name), "ab") as f:
+                np.asarray(self._scalars[name], dtype=_column_dtype(name)).tofile(f)
+
+        self._clear_buffer()
+
+    def close(self):
+        self.flush()
+        _open_shards.discard(self.shard_dir)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class ResultsReader:
+    def __init__(self, path):
+        """Reads a results store written by ResultsWriter.
+
+        Columns are memory mapped, so only the data that is accessed is read from disk.
+        Rows are numbered across shards in the order of the sorted shard names.
+        Use the "design_id" column to map rows back to the designs that produced them.
+
+        Args:
+            path (str): Directory of the results store.
+        """
+        self.path = path
+        self.shards = []
+        self._row_starts = [0]
+
+        for shard in sorted(os.listdir(path)):
+            shard_dir = os.path.join(path, shard)
+            if not os.path.isdir(shard_dir):
+                continue
+            # Shards being written to or left by an interrupted flush may end with incomplete rows
+            num_rows, num_values = _complete_rows(shard_dir)
+            if num_rows == 0:
+                continue
+            columns = {name: _open_column(shard_dir, name, num_rows) for name in SCALARS}
+            for name in VECTORS:
+                columns[name] = _open_column(shard_dir, name, num_values)
+            self.shards.append(columns)
+            self._row_starts.append(self._row_starts[-1] + num_rows)
+
+    def __len__(self):
+        return self._row_starts[-1]
+
+    def column(self, name):
+        """Scalar column over all rows. Zero copy when the store has a single shard.
+
+        Args:
+            name (str): Name of the scalar column (see SCALARS).
+
+        Returns:
+            array: Column values, shape (len(self),) or (len(self), width).
+        """
+        if name not in SCALARS:
+            raise KeyError(f"\"{name}\" is not a scalar column")
+        if len(self.shards) == 1:
+            return self.shards[0][name]
+        if len(self.shards) == 0:
+            width = _column_width(name)
+            return np.empty((0,) if width == 1 else (0, width), dtype=_column_dtype(name))
+        return np.concatenate([shard[name] for shard in self.shards])
+
+    def select(self, status=None, alpha_min=None, alpha_max=None):
+        """Rows matching the given hover status and thrust to weight ratio.
+           Only the "status" and "alpha" columns are read.
+
+        Args:
+            status (str or list): Hover status ("ST", "SP", "N") or list of statuses.
+            alpha_min (float): Minimum max thrust to weight ratio.
+            alpha_max (float): Maximum max thrust to weight ratio.
+
+        Returns:
+            array: Indices of the matching rows.
+        """
+        if isinstance(status, str) or status is None:
+            status = [] if status is None else [status]
+        codes = [STATUS_CODES[s] for s in status]
+
+        rows = []
+        for start, shard in zip(self._row_starts, self.shards):
+            mask = np.ones(len(shard["status"]), dtype=bool)
+            if codes:
+                mask &= np.isin(shard["status"], codes)
+            if alpha_min is not None:
+                mask &= shard["alpha"] >= alpha_min
+            if alpha_max is not None:
+                mask &= shard["alpha"] <= alpha_max
+            rows.append(start + np.flatnonzero(mask))
+        return np.concatenate(rows) if rows else np.empty(0, dtype=np.int64)
+
+    def vector(self, name, row):
+        """Per-propeller values of one row, as a view into the memory mapped column.
+
+        Args:
+            name (str): Name of the per-propeller column ("eta", "u" or "w_hat").
+            row (int): Row index.
+
+        Returns:
+            array: Values for each propeller, shape (num_props,).
+        """
+        if name not in VECTORS:
+            raise KeyError(f"\"{name}\" is not a per-propeller column")
+        if row < 0:
+            row += len(self)
+        if row < 0 or row >= len(self):
+            raise IndexError(f"Row {row} out of range for results store with {len(self)} rows")
+
+        idx = np.searchsorted(self._row_starts, row, side="right") - 1
+        shard = self.shards[idx]
+        local = row - self._row_starts[idx]
+        offset = int(shard["offset"][local])
+        return shard[name][offset:offset + int(shard["num_props"][local])]
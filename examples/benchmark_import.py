@@ -0,0 +1,43 @@
+import subprocess
+import sys
+
+# Each snippet runs in a fresh interpreter, as a spawned worker process would
+SNIPPETS = {
+    "import dronehover": "import dronehover",
+    "import Hover": "from dronehover.optimization import Hover",
+    "build Bf/Bm": ("from dronehover.bodies.standard_bodies import Quadcopter\n"
+                    "from dronehover.optimization import Hover\n"
+                    "sim = Hover(Quadcopter(0.110))"),
+}
+
+CHECK_SCIPY = "\nimport sys\nprint('scipy' in sys.modules)"
+
+def import_time(code, repeats):
+    """Smallest cumulative import time (in us) reported by -X importtime for dronehover.
+    """
+    best = None
+    for _ in range(repeats):
+        out = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                             capture_output=True, text=True, check=True)
+        total = 0
+        for line in out.stderr.splitlines():
+            fields = line.split("|")
+            if len(fields) == 3 and fields[2].strip().startswith("dronehover"):
+                if not fields[2].startswith("  "):  # Top level dronehover imports only
+                    total += int(fields[1])
+        best = total if best is None else min(best, total)
+    return best
+
+if __name__ == "__main__":
+    repeats = 5
+    failed = False
+    for name, code in SNIPPETS.items():
+        t = import_time(code, repeats)
+        out = subprocess.run([sys.executable, "-c", code + CHECK_SCIPY],
+                             capture_output=True, text=True, check=True)
+        scipy_loaded = out.stdout.strip().splitlines()[-1] == "True"
+        failed = failed or scipy_loaded
+        print(f"{name:<20} {t/1000:8.2f} ms   scipy loaded: {scipy_loaded}")
+
+    if failed:
+        sys.exit("SciPy should only be imported when a hover solve is run")
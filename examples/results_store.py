@@ -0,0 +1,50 @@
+import tempfile
+from multiprocessing import get_context
+
+import numpy as np
+from numpy import sin, cos, pi
+
+from dronehover.bodies.custom_bodies import Custombody
+
+from dronehover.optimization import Hover
+
+from dronehover.results import ResultsWriter, ResultsReader
+
+def random_drone(rng):
+    # Random number of propellers with random locations and thrust directions
+    num_props = rng.integers(3, 9)
+    props = []
+    for i in range(num_props):
+        arm = rng.uniform(0, 2*pi)
+        d = rng.normal(size=3) + [0, 0, -2]
+        props.append({"loc":[0.110*cos(arm), 0.110*sin(arm), 0],
+                      "dir": [d[0], d[1], d[2], rng.choice(["ccw", "cw"])],
+                      "propsize": 5})
+    return Custombody(props)
+
+def sweep(args):
+    path, seed, num_designs = args
+    rng = np.random.default_rng(seed)
+    # One writer (shard) per worker process
+    with ResultsWriter(path, shard=f"worker{seed}") as writer:
+        for i in range(num_designs):
+            sim = Hover(random_drone(rng))
+            sim.compute_hover()
+            writer.append(sim, design_id=seed*num_designs + i)
+
+if __name__ == "__main__":
+    path = tempfile.mkdtemp()
+
+    with get_context("spawn").Pool(4) as pool:
+        pool.map(sweep, [(path, seed, 10) for seed in range(4)])
+
+    results = ResultsReader(path)
+    print(f"Designs: {len(results)}")
+
+    rows = results.select(status=["ST", "SP"], alpha_min=1.5)
+    print(f"Hovering designs with max thrust to weight above 1.5: {len(rows)}")
+
+    design_id = results.column("design_id")
+    cost = results.column("input_cost")
+    for row in rows[:5]:
+        print(f"Design {design_id[row]}: input cost {cost[row]:.5f}, u = {results.vector('u', row)}")
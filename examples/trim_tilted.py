@@ -0,0 +1,31 @@
+import numpy as np
+from numpy import sin, cos, pi
+
+from dronehover.bodies.custom_bodies import Custombody
+
+from dronehover.optimization import Hover, attitude_grid
+
+if __name__ == "__main__":
+    # Hexacopter with propellers tilted alternately about their arms
+    tilt = 0.5
+    props = []
+    for i in range(6):
+        arm = i/3*pi
+        t = tilt*(-1)**i
+        props.append({"loc":[0.150*cos(arm), 0.150*sin(arm), 0],
+                      "dir": [-sin(t)*sin(arm), sin(t)*cos(arm), -cos(t), "ccw" if i%2 else "cw"],
+                      "propsize": 5})
+
+    drone = Custombody(props)
+
+    # Define hovering optimizer for drone
+    sim = Hover(drone)
+
+    # Hover at a commanded attitude [roll, pitch]
+    sim.trim([0, 0], verbose=True)
+
+    # Feasibility and cost map over all orientations of gravity in the body frame
+    attitudes = attitude_grid(num_roll=72, num_pitch=37)
+    feasible, eta, cost = sim.trim_map(attitudes)
+    print(f"Feasible attitudes: {np.sum(feasible)}/{len(attitudes)}")
+    print(f"Minimum input cost: {np.nanmin(cost):.5f}")